@@ -1,4 +1,7 @@
+import multiprocessing
+
 from .cli import main
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # process pool workers in frozen builds
     raise SystemExit(main())
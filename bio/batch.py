@@ -1,15 +1,50 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Iterable, List, Sequence, Callable, Optional
+from typing import Iterable, Iterator, List, Sequence, Callable, Optional
+import os
 import threading
+import time
 
-from .engine import SUPPORTED_EXTS, process_image
+from .engine import (
+    SUPPORTED_EXTS,
+    DecodedImage,
+    EncodedImage,
+    close_output_dir_fds,
+    decode_image,
+    encode_image,
+    process_image,
+    write_output,
+)
 from .results import ProcessResult
 from .settings import OptimizeSettings
 
 
+# Threads for each I/O stage of the pipeline executor (read and write).
+PIPELINE_IO_THREADS = 2
+
+# Process pool: files under SMALL_IMAGE_BYTES are sent to workers in chunks
+# of up to SMALL_IMAGE_CHUNKSIZE; bigger files one per task, on their own pool.
+SMALL_IMAGE_BYTES = 256 * 1024
+SMALL_IMAGE_CHUNKSIZE = 32
+
+# Sequential mode: how many source files are read ahead of the encoder.
+PREFETCH_DEPTH = 4
+
+# Where os.posix_fadvise exists (Linux), the kernel is asked to start reading
+# source files this many at a time, about one batch ahead of the results.
+READAHEAD_BATCH = 64
+_CAN_FADVISE = hasattr(os, "posix_fadvise")
+
+# Seconds; progress_callback fires at least this often (~60 Hz) when files are slow
+PROGRESS_MIN_INTERVAL = 1 / 60
+
+
 @dataclass(frozen=True)
 class BatchSummary:
     total_files: int
@@ -29,28 +64,58 @@ class BatchSummary:
         return (self.saved_bytes / self.total_src_bytes) * 100.0
 
 
-def _is_relative_to(child: Path, parent: Path) -> bool:
-    """Compat helper for Python < 3.9 Path.is_relative_to()."""
-    try:
-        child.relative_to(parent)
-        return True
-    except ValueError:
-        return False
+def _scandir_recursive(
+    path: str,
+    recursive: bool = True,
+    exclude_prefix: Optional[str] = None,
+) -> Iterator[os.DirEntry]:
+    """
+    Yield DirEntry objects for the files under path, depth-first.
+
+    Hidden folders (".git", ".cache", ...) and the folder matching
+    exclude_prefix (must end with a separator) are skipped without being
+    opened. Symlinks to files are yielded; symlinks to folders are not
+    followed. Folders we can't read are skipped.
+    """
+    stack = [path]
+    while stack:
+        subdirs = []
+        try:
+            it = os.scandir(stack.pop())
+        except PermissionError:
+            continue
+
+        with it:
+            for entry in it:
+                if entry.is_file():
+                    yield entry
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    if entry.name.startswith("."):
+                        continue
+                    if exclude_prefix and (entry.path + os.sep).startswith(exclude_prefix):
+                        continue
+                    subdirs.append(entry.path)
+
+        # Reversed, so the first subfolder is popped (walked) first
+        stack.extend(reversed(subdirs))
 
 
 def iter_images(
     paths: Sequence[Path],
     recursive: bool = True,
     exclude_dir: Optional[Path] = None,
-) -> Iterable[Path]:
+) -> Iterable[tuple[Path, int]]:
     """
-    Yield supported image paths from a mixture of files and directories.
+    Yield (path, size_in_bytes) for supported images from a mixture of
+    files and directories. Folders are walked depth-first, skipping hidden
+    folders and not following folder symlinks.
 
     exclude_dir:
         If provided, any files inside this directory will be skipped.
         (Prevents re-processing output files when output_dir is inside input_dir.)
     """
-    exclude_resolved = exclude_dir.resolve() if exclude_dir else None
+    # Trailing separator so "out" doesn't also exclude "output"
+    excl = os.path.join(str(exclude_dir.resolve()), "") if exclude_dir else None
 
     for p in paths:
         p = Path(p)
@@ -58,24 +123,281 @@ def iter_images(
         # If it's a file, just yield it if supported and not excluded
         if p.is_file():
             if p.suffix.lower() in SUPPORTED_EXTS:
-                if exclude_resolved and _is_relative_to(p.resolve(), exclude_resolved):
+                if excl and str(p.resolve()).startswith(excl):
                     continue
-                yield p
+                yield p, p.stat().st_size
             continue
 
         # If it's a directory, walk it
         if p.is_dir():
-            pattern = "**/*" if recursive else "*"
-            for f in p.glob(pattern):
-                if not f.is_file():
-                    continue
-                if f.suffix.lower() not in SUPPORTED_EXTS:
-                    continue
+            root = str(p.resolve())
+            if excl and os.path.join(root, "").startswith(excl):
+                continue  # the whole input folder lives inside exclude_dir
 
-                if exclude_resolved and _is_relative_to(f.resolve(), exclude_resolved):
+            for entry in _scandir_recursive(root, recursive, excl):
+                # Cheaper than splitext(): only the short extension slice gets lowercased
+                name = entry.name
+                dot = name.rfind(".")
+                if dot <= 0 or name[dot:].lower() not in SUPPORTED_EXTS:
                     continue
 
-                yield f
+                yield Path(entry.path), entry.stat().st_size
+
+
+def _resolve_workers(settings: OptimizeSettings, total: int) -> int:
+    workers = settings.workers or os.cpu_count() or 1
+    return max(1, min(int(workers), total))
+
+
+def _iter_results(
+    image_list: List[tuple[Path, int]],
+    settings: OptimizeSettings,
+    workers: int,
+    cancel_event: Optional[threading.Event] = None,
+) -> Iterator[ProcessResult]:
+    """
+    Yield one ProcessResult per image, in the same order as image_list.
+
+    With workers > 1 the images are encoded in a process pool (Pillow only
+    releases the GIL for parts of decode/encode, so threads don't scale).
+    Once cancel_event is set no new work is handed out, but results for work
+    already handed out are still yielded, so every file written gets reported.
+    Closing the generator early cancels any work that hasn't started yet.
+    """
+    if workers <= 1:
+        results = _iter_results_prefetched(image_list, settings, cancel_event)
+    elif settings.executor == "pipeline":
+        results = _iter_results_pipelined(image_list, settings, workers, cancel_event)
+    else:
+        results = _iter_results_pooled(image_list, settings, workers, cancel_event)
+
+    if not _CAN_FADVISE:
+        yield from results
+        return
+
+    _hint_readahead(image_list[:2 * READAHEAD_BATCH])
+    with closing(results):
+        for i, result in enumerate(results, 1):
+            if i % READAHEAD_BATCH == 0:
+                _hint_readahead(image_list[i + READAHEAD_BATCH:i + 2 * READAHEAD_BATCH])
+            yield result
+
+
+def _hint_readahead(items: Sequence[tuple[Path, int]]) -> None:
+    """
+    POSIX_FADV_WILLNEED on a batch of files: the kernel queues the reads and
+    returns immediately, so by the time a worker opens a file it is usually
+    already in the page cache. Hints only; failures are ignored.
+    """
+    for img_path, _ in items:
+        try:
+            fd = os.open(img_path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _process_chunk(items: List[tuple[Path, int]], settings: OptimizeSettings) -> List[ProcessResult]:
+    """Worker side of the process pool: one task runs a whole chunk of files."""
+    return [process_image(img_path, settings, src_bytes) for img_path, src_bytes in items]
+
+
+def _iter_bucket(
+    pool: ProcessPoolExecutor,
+    items: List[tuple[Path, int]],
+    settings: OptimizeSettings,
+    chunksize: int,
+    queue_depth: int,
+    cancel_event: Optional[threading.Event],
+) -> Iterator[ProcessResult]:
+    """
+    Yield results for items, in order, keeping at most queue_depth chunks
+    queued in the pool. Once cancel_event is set, chunks that haven't started
+    are cancelled and the rest (already running or done) are still yielded.
+    """
+    chunks = (items[i:i + chunksize] for i in range(0, len(items), chunksize))
+    queued: deque[Future] = deque(
+        pool.submit(_process_chunk, chunk, settings)
+        for chunk in islice(chunks, queue_depth)
+    )
+
+    while queued:
+        if cancel_event and cancel_event.is_set():
+            chunks = iter(())
+            for future in queued:
+                future.cancel()
+
+        future = queued.popleft()
+        if future.cancelled():
+            continue
+
+        for chunk in islice(chunks, 1):
+            queued.append(pool.submit(_process_chunk, chunk, settings))
+
+        yield from future.result()
+
+
+def _iter_results_pooled(
+    image_list: List[tuple[Path, int]],
+    settings: OptimizeSettings,
+    workers: int,
+    cancel_event: Optional[threading.Event] = None,
+) -> Iterator[ProcessResult]:
+    """
+    Process pool, split by file size:
+    - small files go out in big chunks, otherwise the per-task IPC costs
+      more than the encode itself;
+    - large files go out one at a time, so one slow file doesn't hold up a
+      whole chunk behind it.
+    Both pools run side by side and share the budget: together they never
+    have more than `workers` processes. If every file lands in one bucket
+    that bucket gets all of them, otherwise they are split by file count.
+    Results are still yielded in image_list order; after a cancel, whatever
+    the workers did finish is yielded and the rest skipped.
+    """
+    small = [item for item in image_list if item[1] < SMALL_IMAGE_BYTES]
+    large = [item for item in image_list if item[1] >= SMALL_IMAGE_BYTES]
+
+    if not small:
+        large_workers = workers
+    elif not large:
+        large_workers = 0
+    else:
+        # Split by file count; workers >= 2 here, so both pools get at least one process
+        share = round(workers * len(large) / len(image_list))
+        large_workers = min(max(1, share), workers - 1, len(large))
+    small_workers = workers - large_workers
+
+    pools: List[ProcessPoolExecutor] = []
+
+    def run_bucket(items: List[tuple[Path, int]], max_workers: int, chunksize: int) -> Iterator[ProcessResult]:
+        if not items:
+            return iter(())
+        max_workers = min(max_workers, len(items))
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+        pools.append(pool)
+        # One chunk running per worker plus one spare keeps them all busy; anything
+        # queued beyond that is only more work to finish (and write) after a cancel
+        return _iter_bucket(pool, items, settings, chunksize, max_workers + 1, cancel_event)
+
+    try:
+        small_results = run_bucket(
+            small,
+            small_workers,
+            chunksize=min(SMALL_IMAGE_CHUNKSIZE, max(1, len(small) // (4 * max(1, small_workers)))),
+        )
+        large_results = run_bucket(large, large_workers, chunksize=1)
+
+        for _, src_bytes in image_list:
+            r = next(small_results if src_bytes < SMALL_IMAGE_BYTES else large_results, None)
+            if r is not None:
+                yield r
+    finally:
+        for pool in pools:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _iter_results_prefetched(
+    image_list: List[tuple[Path, int]],
+    settings: OptimizeSettings,
+    cancel_event: Optional[threading.Event] = None,
+) -> Iterator[ProcessResult]:
+    """
+    Sequential processing, but the next PREFETCH_DEPTH files are read into
+    memory on helper threads while the current one encodes, so the disk
+    isn't idle during CPU work (and vice versa). Several reads in flight
+    help on HDDs and network shares where a single read is mostly latency;
+    the extra memory is capped at PREFETCH_DEPTH source files.
+    """
+    with ThreadPoolExecutor(max_workers=PREFETCH_DEPTH, thread_name_prefix="bio-prefetch") as reader:
+        pending: deque[Future] = deque()
+        to_read = iter(image_list)
+
+        for img_path, _ in islice(to_read, PREFETCH_DEPTH):
+            pending.append(reader.submit(img_path.read_bytes))
+
+        for img_path, src_bytes in image_list:
+            if cancel_event and cancel_event.is_set():
+                return
+
+            data = pending.popleft().result()
+            for nxt_path, _ in islice(to_read, 1):
+                pending.append(reader.submit(nxt_path.read_bytes))
+
+            yield process_image(img_path, settings, src_bytes, data)
+
+
+def _iter_results_pipelined(
+    image_list: List[tuple[Path, int]],
+    settings: OptimizeSettings,
+    workers: int,
+    cancel_event: Optional[threading.Event] = None,
+) -> Iterator[ProcessResult]:
+    """
+    Overlap disk I/O with encoding: read+decode, transform+encode and
+    write+stat each run on their own thread pool, so a slow disk read no
+    longer stalls the encoder (and vice versa).
+
+    Each stage hands its output to the next pool itself; the only thing we
+    wait on here is the final ProcessResult, in image_list order. At most
+    2*workers files are in flight, which bounds decoded images held in RAM.
+
+    Once cancel_event is set, each stage drops its file instead of handing it
+    on (None in place of a result), so nothing new reaches write_output. Files
+    already being written still finish and are yielded.
+    """
+    read_pool = ThreadPoolExecutor(PIPELINE_IO_THREADS, thread_name_prefix="bio-read")
+    cpu_pool = ThreadPoolExecutor(workers, thread_name_prefix="bio-encode")
+    write_pool = ThreadPoolExecutor(PIPELINE_IO_THREADS, thread_name_prefix="bio-write")
+
+    def cancelled() -> bool:
+        return cancel_event is not None and cancel_event.is_set()
+
+    def read(img_path: Path, src_bytes: int):
+        if cancelled():
+            return None
+        staged = decode_image(img_path, settings, src_bytes)
+        if isinstance(staged, ProcessResult):
+            return staged
+        if cancelled():
+            return None
+        if isinstance(staged, EncodedImage):
+            return write_pool.submit(write_output, staged)
+        return cpu_pool.submit(encode, staged)
+
+    def encode(decoded: DecodedImage):
+        if cancelled():
+            return None
+        encoded = encode_image(decoded)
+        if cancelled():
+            return None
+        return write_pool.submit(write_output, encoded)
+
+    in_flight: deque[Future] = deque()
+    pending = iter(image_list)
+    try:
+        for img_path, src_bytes in islice(pending, 2 * workers):
+            in_flight.append(read_pool.submit(read, img_path, src_bytes))
+
+        while in_flight:
+            r = in_flight.popleft().result()
+            while isinstance(r, Future):
+                r = r.result()
+
+            nxt = None if cancelled() else next(pending, None)
+            if nxt is not None:
+                in_flight.append(read_pool.submit(read, *nxt))
+
+            if r is not None:
+                yield r
+    finally:
+        for pool in (read_pool, cpu_pool, write_pool):
+            pool.shutdown(wait=True, cancel_futures=True)
 
 
 def process_batch(
@@ -85,32 +407,74 @@ def process_batch(
     progress_callback: Optional[Callable[[int, int], None]] = None,
     cancel_event: Optional[threading.Event] = None,
     file_callback: Optional[Callable[[Path, int, int], None]] = None,
+    result_callback: Optional[Callable[[ProcessResult, int, int], None]] = None,
 ) -> tuple[List[ProcessResult], BatchSummary]:
+    """
+    Optimize every supported image found under inputs.
+
+    file_callback fires when a file is up next, result_callback once its
+    ProcessResult is in (lets callers stream per-file reports).
+
+    Workers (processes or pipeline threads) only ever hand back a
+    ProcessResult; all totals are folded into plain locals here, on the
+    calling thread. Nothing is shared between workers, so there is no lock
+    to contend on. Callbacks also run on the calling thread.
+    """
     results: List[ProcessResult] = []
 
     total_src = 0
     total_out = 0
     processed = 0
     skipped = 0
-    total_files = 0
 
     image_list = list(iter_images(inputs, recursive=recursive, exclude_dir=settings.output_dir))
     total = len(image_list)
+    workers = _resolve_workers(settings, total)
 
-    for idx, img_path in enumerate(image_list, start=1):
-        if cancel_event and cancel_event.is_set():
-            break
+    # Once per batch, not per image: write_output expects the folder to exist
+    settings.output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Throttle progress_callback on big batches: every progress_step files,
+    # or when the last call is more than a frame old, and always for the last file
+    progress_step = max(1, total // 1000)
+    last_progress = time.monotonic()
+
+    # Results come back in image_list order, so callbacks still fire per file
+    # in sequence; next() just blocks until that file's worker has finished.
+    try:
+        with closing(_iter_results(image_list, settings, workers, cancel_event)) as outcomes:
+            for idx, (img_path, _) in enumerate(image_list, start=1):
+                if cancel_event and cancel_event.is_set():
+                    break
+
+                if progress_callback:
+                    now = time.monotonic()
+                    if idx % progress_step == 0 or idx == total or now - last_progress > PROGRESS_MIN_INTERVAL:
+                        progress_callback(idx, total)
+                        last_progress = now
+
+                if file_callback:
+                    file_callback(img_path, idx, total)
 
-        if progress_callback:
-            progress_callback(idx, total)
+                r = next(outcomes, None)
+                if r is None:
+                    break  # cancelled while waiting
+                results.append(r)
 
-        if file_callback:
-            file_callback(img_path, idx, total)
+                if result_callback:
+                    result_callback(r, idx, total)
 
-        total_files += 1
-        r = process_image(img_path, settings)
-        results.append(r)
+            # Cancelled: files already handed to a worker may have been written,
+            # so collect those results too and keep the report in step with disk
+            for idx, r in enumerate(outcomes, start=len(results) + 1):
+                results.append(r)
+                if result_callback:
+                    result_callback(r, idx, total)
+    finally:
+        # Output folder fds cached while writing (sequential/pipeline modes)
+        close_output_dir_fds()
 
+    for r in results:
         total_src += r.src_bytes
         total_out += r.out_bytes
 
@@ -120,7 +484,7 @@ def process_batch(
             processed += 1
 
     summary = BatchSummary(
-        total_files=total_files,
+        total_files=len(results),
         processed=processed,
         skipped=skipped,
         total_src_bytes=total_src,
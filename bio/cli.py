@@ -63,6 +63,21 @@ def build_parser() -> argparse.ArgumentParser:
         help="Allow processing files that already have the output suffix",
     )
     opt.add_argument("--no-recursive", action="store_true", help="Do not scan folders recursively")
+    opt.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU core, 1 = no pool)",
+    )
+    opt.add_argument(
+        "--executor",
+        choices=["process", "pipeline"],
+        default="process",
+        help=(
+            "process: worker processes run whole files (small files in batches, "
+            "large ones on a separate pool); pipeline: threaded read/encode/write stages"
+        ),
+    )
 
     # Format
     fmt = opt.add_mutually_exclusive_group()
@@ -80,6 +95,12 @@ def build_parser() -> argparse.ArgumentParser:
     opt.add_argument("--max-height", type=int, default=None, help="Max height (keeps aspect)")
     opt.add_argument("--scale", type=int, default=None, help="Scale percent (e.g. 50)")
     opt.add_argument("--allow-upscale", action="store_true", help="Allow enlarging pixels")
+    opt.add_argument(
+        "--resize-backend",
+        choices=["pillow", "opencv"],
+        default="pillow",
+        help="Resize library (opencv needs opencv-python; falls back to pillow)",
+    )
 
     # Crop
     opt.add_argument("--crop", type=str, default=None, help='Center crop ratio, e.g. "1:1" or "16:9"')
@@ -88,6 +109,17 @@ def build_parser() -> argparse.ArgumentParser:
     opt.add_argument("--quality", type=int, default=82, help="JPEG quality (1-100), default 82")
     opt.add_argument("--webp-quality", type=int, default=80, help="WebP quality (1-100), default 80")
     opt.add_argument("--webp-lossless", action="store_true", help="WebP lossless mode")
+    opt.add_argument(
+        "--lossless-tools",
+        action="store_true",
+        help="Use oxipng/jpegtran when installed (lossless PNG recompress, JPEG passthrough)",
+    )
+    opt.add_argument(
+        "--engine",
+        choices=["pillow", "vips"],
+        default="pillow",
+        help="Image library (vips needs pyvips; falls back to pillow)",
+    )
 
     return p
 
@@ -131,11 +163,16 @@ def main(argv: list[str] | None = None) -> int:
             max_height=args.max_height,
             scale_percent=args.scale,
             allow_upscale=bool(args.allow_upscale),
+            resize_backend=args.resize_backend,
             crop_ratio=crop_ratio,
             jpeg_quality=int(args.quality),
             webp_quality=int(args.webp_quality),
             webp_lossless=bool(args.webp_lossless),
+            use_lossless_tools=bool(args.lossless_tools),
+            engine=args.engine,
             dry_run=bool(args.dry_run),
+            workers=args.workers,
+            executor=args.executor,
         )
 
         if args.preset:
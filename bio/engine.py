@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import replace
+from dataclasses import dataclass, replace
 from pathlib import Path
+import functools
+import io
+import itertools
+import math
 import os
-import tempfile
+import shutil
+import subprocess
 
-from PIL import Image, ImageOps
+from PIL import ExifTags, Image, ImageOps
 
 from .results import ProcessResult
 from .settings import OptimizeSettings
 
 
-SUPPORTED_EXTS = {".jpg", ".jpeg", ".png", ".webp"}
+SUPPORTED_EXTS = frozenset({".jpg", ".jpeg", ".png", ".webp"})
 
 # Maps "keep" to the correct encoder format based on source extension.
 EXT_TO_FORMAT = {
@@ -27,11 +32,86 @@ FORMAT_TO_EXT = {
     "webp": ".webp",
 }
 
+# webp_method used for images above OptimizeSettings.webp_method_cap_mpixels
+WEBP_CAPPED_METHOD = 4
+
+# Windows opens fds in text mode unless told otherwise (would mangle \n bytes)
+_O_BINARY = getattr(os, "O_BINARY", 0)
+_CREATE_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | _O_BINARY
+
+# Output folder fds, opened once per process (pool workers included) and
+# reused so each open/rename in that folder skips the path walk.
+# Not available on Windows, where we just use full paths.
+# os.replace is never listed in supports_dir_fd, but it shares os.rename's
+# implementation (same src_dir_fd/dst_dir_fd support), so check rename.
+_USE_DIR_FD = {os.open, os.rename, os.unlink} <= os.supports_dir_fd
+_DIR_FDS: dict[str, int] = {}
+
+# Temp file names (see _write_temp); next() on a count is atomic under the GIL
+_TMP_COUNTER = itertools.count()
+
+
+@dataclass(frozen=True)
+class DecodedImage:
+    """Output of the read+decode stage: pixels loaded, nothing transformed yet."""
+    src_path: Path
+    src_bytes: int
+    settings: OptimizeSettings
+    image: Image.Image
+    # Final size, when the decoder already downscaled (JPEG draft mode).
+    # Worked out from the full-size header, so it matches a full decode.
+    resize_to: tuple[int, int] | None = None
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    """Output of the transform+encode stage: the encoded file, still in memory."""
+    src_path: Path
+    src_bytes: int
+    settings: OptimizeSettings
+    out_format: str
+    data: io.BytesIO
+
+
+def process_image(
+    src_path: Path,
+    s: OptimizeSettings,
+    src_bytes: int | None = None,
+    src_data: bytes | None = None,
+) -> ProcessResult:
+    """
+    Run all three stages for one file.
 
-def process_image(src_path: Path, s: OptimizeSettings) -> ProcessResult:
+    src_bytes can be passed in when the caller already knows the source size
+    (e.g. from iter_images), saving a stat() per image. src_data is the
+    file's content if the caller has already read it (prefetching).
+    s.output_dir must exist (process_batch creates it).
+    """
+    staged = decode_image(src_path, s, src_bytes, src_data)
+    if isinstance(staged, ProcessResult):
+        return staged
+    if isinstance(staged, EncodedImage):
+        return write_output(staged)
+    return write_output(encode_image(staged))
+
+
+def decode_image(
+    src_path: Path,
+    s: OptimizeSettings,
+    src_bytes: int | None = None,
+    src_data: bytes | None = None,
+) -> DecodedImage | EncodedImage | ProcessResult:
+    """
+    Stage 1 (read + decode).
+
+    Returns a ProcessResult instead when the file is skipped before decoding,
+    or an EncodedImage when jpegtran or libvips already produced the output
+    (stage 2 is skipped then).
+    """
     src_path = Path(src_path)
 
-    src_bytes = _file_size(src_path)
+    if src_bytes is None:
+        src_bytes = _file_size(src_path)
 
     if src_path.suffix.lower() not in SUPPORTED_EXTS:
         return ProcessResult(
@@ -56,85 +136,296 @@ def process_image(src_path: Path, s: OptimizeSettings) -> ProcessResult:
 
     s = _normalize_settings(s)
 
-    # Ensure output directory exists
-    s.output_dir.mkdir(parents=True, exist_ok=True)
+    source = io.BytesIO(src_data) if src_data is not None else src_path
+    with Image.open(source) as im:
+        if s.use_lossless_tools and _can_jpegtran(im, src_path, s):
+            data = _jpegtran(src_data if src_data is not None else src_path.read_bytes(), s)
+            if data is not None:
+                return EncodedImage(
+                    src_path=src_path,
+                    src_bytes=src_bytes,
+                    settings=s,
+                    out_format="jpeg",
+                    data=data,
+                )
+
+        if s.engine == "vips":
+            data = _vips_encode(im, src_path, src_data, s)
+            if data is not None:
+                return EncodedImage(
+                    src_path=src_path,
+                    src_bytes=src_bytes,
+                    settings=s,
+                    out_format=_choose_output_format(src_path, s),
+                    data=data,
+                )
 
-    with Image.open(src_path) as im:
+        resize_to = _draft_for_resize(im, s)
         im.load()
 
-        # Auto-orient (important if we're stripping EXIF)
-        if s.auto_orient:
-            im = ImageOps.exif_transpose(im)
+    return DecodedImage(
+        src_path=src_path,
+        src_bytes=src_bytes,
+        settings=s,
+        image=im,
+        resize_to=resize_to,
+    )
+
+
+def encode_image(decoded: DecodedImage) -> EncodedImage:
+    """Stage 2 (transform + encode). CPU only, never touches the output dir."""
+    s = decoded.settings
+    im = decoded.image
 
-        # Center crop (optional)
-        im = _apply_center_crop(im, s)
+    # Auto-orient (important if we're stripping EXIF).
+    # in_place: without it, exif_transpose returns a full copy even when
+    # there is nothing to rotate.
+    if s.auto_orient:
+        ImageOps.exif_transpose(im, in_place=True)
 
-        # Resize (optional)
+    # Center crop (optional)
+    im = _apply_center_crop(im, s)
+
+    # Resize (optional)
+    if decoded.resize_to is not None:
+        im = _resize(im, decoded.resize_to, s)
+    else:
         im = _apply_resize(im, s)
 
-        out_format = _choose_output_format(src_path, s)
-        out_path = _build_output_path(src_path, s, out_format)
+    out_format = _choose_output_format(decoded.src_path, s)
+
+    # If converting to JPEG and image has alpha, flatten onto background.
+    if out_format == "jpeg" and _has_alpha(im):
+        im = _flatten_alpha(im, s.jpeg_background)
+
+    # Encode to memory first (lets us enforce only_if_smaller without disk I/O)
+    data = _save_to_buffer(im, s, out_format, s.strip_metadata)
 
-        if out_path.exists() and not s.overwrite:
-            out_path = _next_available_name(out_path)
+    if out_format == "png" and s.use_lossless_tools:
+        data = _oxipng(data, s)
 
-        # If converting to JPEG and image has alpha, flatten onto background.
-        if out_format == "jpeg" and _has_alpha(im):
-            im = _flatten_alpha(im, s.jpeg_background)
+    return EncodedImage(
+        src_path=decoded.src_path,
+        src_bytes=decoded.src_bytes,
+        settings=s,
+        out_format=out_format,
+        data=data,
+    )
 
-        # Write to a temp file first (lets us enforce only_if_smaller safely)
-        tmp_path = _save_to_temp(im, s, out_format, s.strip_metadata)
 
-        tmp_bytes = _file_size(tmp_path)
+def write_output(encoded: EncodedImage) -> ProcessResult:
+    """
+    Stage 3 (write + stat).
+
+    s.output_dir must already exist; process_batch creates it once per batch.
+    """
+    s = encoded.settings
+    src_path = encoded.src_path
+    src_bytes = encoded.src_bytes
 
-        if s.dry_run:
-            # Dry run: remove temp file and report estimated result
-            try:
-                tmp_path.unlink(missing_ok=True)
-            except Exception:
-                pass
+    encoded_bytes = encoded.data.getbuffer().nbytes
+
+    if s.dry_run:
+        # Dry run: report estimated result, nothing is written
+        return ProcessResult(
+            src_path=src_path,
+            out_path=None,
+            src_bytes=src_bytes,
+            out_bytes=encoded_bytes,
+            changed=False,
+            skipped_reason="dry_run",
+        )
 
+    if s.only_if_smaller and encoded_bytes >= src_bytes:
+        # Special rule: if the user wants metadata stripped no matter what,
+        # we allow writing even if the file isn't smaller.
+        if not (s.strip_metadata and s.write_even_if_bigger_when_stripping_metadata):
             return ProcessResult(
                 src_path=src_path,
                 out_path=None,
                 src_bytes=src_bytes,
-                out_bytes=tmp_bytes,
+                out_bytes=src_bytes,
                 changed=False,
-                skipped_reason="dry_run",
+                skipped_reason="not_smaller",
             )
+        # else: continue, and we will write the output anyway
 
-        if s.only_if_smaller and tmp_bytes >= src_bytes:
-            # Special rule: if the user wants metadata stripped no matter what,
-            # we allow writing even if the file isn't smaller.
-            if not (s.strip_metadata and s.write_even_if_bigger_when_stripping_metadata):
-                try:
-                    tmp_path.unlink(missing_ok=True)
-                except Exception:
-                    pass
+    out_path = _build_output_path(src_path, s, encoded.out_format)
+    dir_fd = _output_dir_fd(s.output_dir)
 
-                return ProcessResult(
-                    src_path=src_path,
-                    out_path=None,
-                    src_bytes=src_bytes,
-                    out_bytes=src_bytes,
-                    changed=False,
-                    skipped_reason="not_smaller",
-                )
-            # else: continue, and we will write the output anyway
+    if s.overwrite:
+        # Write to a temp file, then atomically replace whatever is there
+        tmp_path = _write_temp(encoded.data, s, encoded.out_format, dir_fd)
+        _finalize_output(tmp_path, out_path, dir_fd)
+    else:
+        # Claim a free name and write straight into it (no temp file, no rename)
+        out_path, fd = _reserve_output_path(out_path, dir_fd)
+        _write_to_fd(fd, out_path, encoded.data, dir_fd)
+
+    # We wrote exactly the encoded buffer, so no need to stat() it back
+    return ProcessResult(
+        src_path=src_path,
+        out_path=out_path,
+        src_bytes=src_bytes,
+        out_bytes=encoded_bytes,
+        changed=True,
+        skipped_reason=None,
+    )
+
+
+def _can_jpegtran(im: Image.Image, src_path: Path, s: OptimizeSettings) -> bool:
+    """
+    True if this job is JPEG -> JPEG with no pixel changes, so jpegtran can
+    rewrite the file losslessly instead of a Pillow decode + re-encode.
+    Only reads header info; call before im.load().
+    """
+    if im.format != "JPEG" or _choose_output_format(src_path, s) != "jpeg":
+        return False
 
-        # Move temp file to final destination (atomic replace if overwrite)
-        _finalize_output(tmp_path, out_path, overwrite=s.overwrite)
+    if s.auto_orient and im.getexif().get(ExifTags.Base.Orientation, 1) != 1:
+        return False  # would need rotating
 
-        out_bytes = _file_size(out_path)
+    size = im.size
+    if s.crop_ratio is not None and _center_crop_box(size, float(s.crop_ratio)) is not None:
+        return False
 
-        return ProcessResult(
-            src_path=src_path,
-            out_path=out_path,
-            src_bytes=src_bytes,
-            out_bytes=out_bytes,
-            changed=True,
-            skipped_reason=None,
+    return _resize_target(size, s) is None
+
+
+def _jpegtran(src: bytes, s: OptimizeSettings) -> io.BytesIO | None:
+    args = ["jpegtran", "-copy", "none" if s.strip_metadata else "all", "-optimize"]
+    if s.jpeg_progressive:
+        args.append("-progressive")
+
+    out = _run_tool(args, src)
+    return io.BytesIO(out) if out is not None else None
+
+
+def _oxipng(data: io.BytesIO, s: OptimizeSettings) -> io.BytesIO:
+    # Re-compress Pillow's PNG; keep whichever is smaller
+    args = ["oxipng", "--opt", "4"]
+    if s.strip_metadata:
+        args += ["--strip", "safe"]
+    args += ["--stdout", "-"]
+
+    out = _run_tool(args, data.getbuffer())
+    if out is None or len(out) >= data.getbuffer().nbytes:
+        return data
+    return io.BytesIO(out)
+
+
+def _run_tool(args: list[str], data) -> bytes | None:
+    """Pipe data through an external optimizer. None if it's missing or fails."""
+    exe = _find_tool(args[0])
+    if exe is None:
+        return None
+
+    try:
+        proc = subprocess.run(
+            [exe, *args[1:]],
+            input=data,
+            capture_output=True,
+            check=True,
+            # Don't flash a console window from the GUI build on Windows
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
         )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return proc.stdout or None
+
+
+@functools.lru_cache(maxsize=None)
+def _find_tool(name: str) -> str | None:
+    return shutil.which(name)
+
+
+def _vips_encode(
+    im: Image.Image,
+    src_path: Path,
+    src_data: bytes | None,
+    s: OptimizeSettings,
+) -> io.BytesIO | None:
+    """
+    Decode, orient, crop, resize and encode with libvips in one pass.
+
+    im is the Pillow image opened on the same file but not loaded; only its
+    header is used, to work out the same geometry as the Pillow path.
+    Returns None, so the caller falls back to Pillow, if pyvips/libvips
+    isn't available or libvips fails on the file.
+    """
+    try:
+        import pyvips
+    except (ImportError, OSError):  # OSError: pyvips installed, libvips missing
+        return None
+
+    out_format = _choose_output_format(src_path, s)
+
+    w, h = im.size
+    orientation = im.getexif().get(ExifTags.Base.Orientation, 1) if s.auto_orient else 1
+    size = (h, w) if orientation in (5, 6, 7, 8) else (w, h)
+
+    box = None
+    if s.crop_ratio is not None:
+        box = _center_crop_box(size, float(s.crop_ratio))
+        if box is not None:
+            size = (box[2] - box[0], box[3] - box[1])
+
+    target = _resize_target(size, s)
+    source = src_data if src_data is not None else src_path.read_bytes()
+
+    try:
+        if target is not None:
+            # thumbnail does shrink-on-load, rotation and the centre crop
+            # itself; target already has the crop's aspect ratio, so
+            # "fill, then crop to target" is the same as crop-then-resize.
+            vim = pyvips.Image.thumbnail_buffer(
+                source,
+                target[0],
+                height=target[1],
+                size="both" if box is not None else "force",
+                crop="centre" if box is not None else "none",
+                no_rotate=not s.auto_orient,
+            )
+        else:
+            # Rotating needs random access; otherwise stream top to bottom
+            rotate = orientation != 1
+            vim = pyvips.Image.new_from_buffer(source, "", access="random" if rotate else "sequential")
+            if rotate:
+                vim = vim.autorot()
+            if box is not None:
+                vim = vim.extract_area(box[0], box[1], box[2] - box[0], box[3] - box[1])
+
+        if out_format == "jpeg" and vim.hasalpha():
+            vim = vim.flatten(background=list(s.jpeg_background))
+
+        return io.BytesIO(vim.write_to_buffer(FORMAT_TO_EXT[out_format], **_vips_save_kwargs(vim, s, out_format)))
+    except pyvips.Error:
+        return None
+
+
+def _vips_save_kwargs(vim, s: OptimizeSettings, out_format: str) -> dict:
+    # Same knobs as _build_save_kwargs, under libvips' names
+    kwargs: dict = {"strip": bool(s.strip_metadata)}
+
+    if out_format == "jpeg":
+        kwargs["Q"] = int(s.jpeg_quality)
+        kwargs["optimize_coding"] = bool(s.jpeg_optimize)
+        kwargs["interlace"] = bool(s.jpeg_progressive)
+
+    elif out_format == "png":
+        kwargs["compression"] = int(s.png_compress_level)
+
+    elif out_format == "webp":
+        kwargs["Q"] = int(s.webp_quality)
+        kwargs["lossless"] = bool(s.webp_lossless)
+        method = int(s.webp_method)
+        cap = s.webp_method_cap_mpixels
+        if cap is not None and vim.width * vim.height > cap * 1_000_000:
+            method = min(method, WEBP_CAPPED_METHOD)
+        kwargs["effort"] = method
+
+    return kwargs
 
 
 def _normalize_settings(s: OptimizeSettings) -> OptimizeSettings:
@@ -160,32 +451,109 @@ def _build_output_path(src_path: Path, s: OptimizeSettings, out_format: str) ->
     return s.output_dir / f"{stem}{ext}"
 
 
-def _next_available_name(path: Path) -> Path:
-    # photo_optimized.jpg -> photo_optimized (1).jpg
+def _output_dir_fd(out_dir: Path) -> int | None:
+    """
+    fd for out_dir, opened on first use and cached for this process.
+    None where dir_fd-relative calls aren't supported (Windows).
+    """
+    if not _USE_DIR_FD:
+        return None
+
+    key = str(out_dir)
+    fd = _DIR_FDS.get(key)
+    if fd is None:
+        fd = os.open(key, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        # Another thread may have raced us here; keep whichever fd won
+        cached = _DIR_FDS.setdefault(key, fd)
+        if cached != fd:
+            os.close(fd)
+            fd = cached
+    return fd
+
+
+def close_output_dir_fds() -> None:
+    """Close fds cached by _output_dir_fd (process_batch calls this when done)."""
+    while _DIR_FDS:
+        _, fd = _DIR_FDS.popitem()
+        os.close(fd)
+
+
+def _open_new(path: Path, dir_fd: int | None) -> int:
+    # O_EXCL create; with a dir fd only the file name needs resolving
+    if dir_fd is not None:
+        return os.open(path.name, _CREATE_FLAGS, 0o644, dir_fd=dir_fd)
+    return os.open(path, _CREATE_FLAGS, 0o644)
+
+
+def _unlink(path: Path, dir_fd: int | None) -> None:
+    try:
+        if dir_fd is not None:
+            os.unlink(path.name, dir_fd=dir_fd)
+        else:
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _reserve_output_path(path: Path, dir_fd: int | None = None) -> tuple[Path, int]:
+    """
+    Claim the first free name and return it with an fd open for writing.
+
+    photo_optimized.jpg -> photo_optimized (1).jpg -> photo_optimized (2).jpg ...
+
+    O_CREAT|O_EXCL makes "is it free?" and "take it" a single syscall, so
+    two workers can never end up writing to the same name.
+    """
     base = path.with_suffix("")
     ext = path.suffix
-    i = 1
+    candidate = path
+    i = 0
     while True:
-        candidate = Path(f"{base} ({i}){ext}")
-        if not candidate.exists():
-            return candidate
-        i += 1
+        try:
+            fd = _open_new(candidate, dir_fd)
+        except FileExistsError:
+            i += 1
+            candidate = Path(f"{base} ({i}){ext}")
+            continue
+        return candidate, fd
 
 
-def _save_to_temp(im: Image.Image, s: OptimizeSettings, out_format: str, strip_metadata: bool) -> Path:
-    # Create temp file in output dir so move/rename is cheap
-    fd, tmp_name = tempfile.mkstemp(prefix="bio_", suffix=FORMAT_TO_EXT[out_format], dir=str(s.output_dir))
-    os.close(fd)
-    tmp_path = Path(tmp_name)
+def _save_to_buffer(im: Image.Image, s: OptimizeSettings, out_format: str, strip_metadata: bool) -> io.BytesIO:
+    buf = io.BytesIO()
 
     save_kwargs = _build_save_kwargs(im, s, out_format, strip_metadata)
 
-    # Important: Pillow chooses encoder by format=... not extension alone
-    im.save(tmp_path, format=out_format.upper(), **save_kwargs)
+    # Important: Pillow chooses encoder by format=... (there is no extension here)
+    im.save(buf, format=out_format.upper(), **save_kwargs)
+
+    return buf
 
+
+def _write_temp(data: io.BytesIO, s: OptimizeSettings, out_format: str, dir_fd: int | None = None) -> Path:
+    # Create temp file in output dir so move/rename is cheap.
+    # pid + counter is unique within this run without any randomness; the
+    # loop only matters if a crashed earlier run left the same name behind.
+    while True:
+        tmp_path = s.output_dir / f"bio_{os.getpid()}_{next(_TMP_COUNTER)}{FORMAT_TO_EXT[out_format]}"
+        try:
+            fd = _open_new(tmp_path, dir_fd)
+        except FileExistsError:
+            continue
+        break
+    _write_to_fd(fd, tmp_path, data, dir_fd)
     return tmp_path
 
 
+def _write_to_fd(fd: int, path: Path, data: io.BytesIO, dir_fd: int | None = None) -> None:
+    # Takes ownership of fd; removes the half-written file if anything fails
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data.getbuffer())
+    except BaseException:
+        _unlink(path, dir_fd)
+        raise
+
+
 def _build_save_kwargs(im: Image.Image, s: OptimizeSettings, out_format: str, strip_metadata: bool) -> dict:
     kwargs: dict = {}
 
@@ -212,18 +580,30 @@ def _build_save_kwargs(im: Image.Image, s: OptimizeSettings, out_format: str, st
     elif out_format == "webp":
         kwargs["quality"] = int(s.webp_quality)
         kwargs["lossless"] = bool(s.webp_lossless)
-        kwargs["method"] = int(s.webp_method)
+        method = int(s.webp_method)
+        cap = s.webp_method_cap_mpixels
+        if cap is not None and im.width * im.height > cap * 1_000_000:
+            method = min(method, WEBP_CAPPED_METHOD)
+        kwargs["method"] = method
 
     return kwargs
 
 
-def _finalize_output(tmp_path: Path, out_path: Path, overwrite: bool) -> None:
-    if overwrite and out_path.exists():
-        out_path.unlink()
-    tmp_path.replace(out_path)
+def _finalize_output(tmp_path: Path, out_path: Path, dir_fd: int | None = None) -> None:
+    # os.replace swaps in the new file atomically, on Windows too
+    if dir_fd is not None:
+        os.replace(tmp_path.name, out_path.name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+    else:
+        os.replace(tmp_path, out_path)
 
 
 def _flatten_alpha(im: Image.Image, background_rgb: tuple[int, int, int]) -> Image.Image:
+    # Alpha band that is 255 everywhere (common for RGBA exports): nothing to
+    # blend, so skip allocating a background and compositing over it.
+    # getextrema() scans bands in place, no per-band copy.
+    if im.mode in ("RGBA", "LA") and im.getextrema()[-1][0] == 255:
+        return im.convert("RGB")
+
     # Ensure we are in RGBA so alpha exists
     rgba = im.convert("RGBA")
     bg = Image.new("RGBA", rgba.size, background_rgb + (255,))
@@ -247,13 +627,57 @@ def _file_size(p: Path) -> int:
 
 
 def _apply_resize(im: Image.Image, s: OptimizeSettings) -> Image.Image:
+    target = _resize_target(im.size, s)
+    if target is None:
+        return im
+    return _resize(im, target, s)
+
+
+def _resize(im: Image.Image, size: tuple[int, int], s: OptimizeSettings) -> Image.Image:
+    if s.resize_backend == "opencv":
+        out = _resize_opencv(im, size)
+        if out is not None:
+            return out
+    return im.resize(size, Image.Resampling.LANCZOS)
+
+
+def _resize_opencv(im: Image.Image, size: tuple[int, int]) -> Image.Image | None:
+    """
+    Resize with cv2.resize, which is SIMD-vectorised and multi-threaded
+    (Pillow's LANCZOS runs on one core). INTER_AREA is used for shrinking.
+
+    Returns None, so the caller falls back to Pillow, if OpenCV isn't
+    installed or the mode isn't plain L/RGB. Images with alpha (RGBA, LA)
+    go to Pillow too: it resizes them with premultiplied alpha, cv2.resize
+    doesn't, which bleeds the colour of transparent pixels into the edges.
     """
-    Apply resizing based on settings.
+    if im.mode not in ("L", "RGB"):
+        return None
+
+    try:
+        import cv2
+        import numpy as np
+    except ImportError:
+        return None
+
+    shrinking = size[0] <= im.width and size[1] <= im.height
+    interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LANCZOS4
+    out = Image.fromarray(cv2.resize(np.asarray(im), size, interpolation=interpolation))
+
+    # Keep exif/icc_profile etc. for when metadata isn't stripped (Pillow's resize does the same)
+    out.info = im.info.copy()
+    return out
+
+
+def _resize_target(size: tuple[int, int], s: OptimizeSettings) -> tuple[int, int] | None:
+    """
+    Work out the resized (width, height) for an image of the given size.
+    Returns None when no resize is needed.
     - scale_percent takes precedence if set
     - otherwise max_width/max_height define a bounding box
     - never upscale unless allow_upscale=True
     """
-    w, h = im.size
+    w, h = size
 
     # 1) Percent scaling
     if s.scale_percent is not None:
@@ -262,33 +686,71 @@ def _apply_resize(im: Image.Image, s: OptimizeSettings) -> Image.Image:
         new_h = max(1, (h * pct) // 100)
 
         if not s.allow_upscale and (new_w > w or new_h > h):
-            return im
-
-        if (new_w, new_h) == (w, h):
-            return im
-
-        return im.resize((new_w, new_h), Image.Resampling.LANCZOS)
+            return None
 
     # 2) Fit within max dimensions
-    if s.max_width is None and s.max_height is None:
-        return im
+    else:
+        if s.max_width is None and s.max_height is None:
+            return None
 
-    max_w = s.max_width if s.max_width is not None else w
-    max_h = s.max_height if s.max_height is not None else h
+        max_w = s.max_width if s.max_width is not None else w
+        max_h = s.max_height if s.max_height is not None else h
 
-    # compute scale factor that keeps aspect ratio
-    scale = min(max_w / w, max_h / h)
+        # compute scale factor that keeps aspect ratio
+        scale = min(max_w / w, max_h / h)
 
-    if not s.allow_upscale and scale >= 1.0:
-        return im
+        if not s.allow_upscale and scale >= 1.0:
+            return None
 
-    new_w = max(1, int(w * scale))
-    new_h = max(1, int(h * scale))
+        new_w = max(1, int(w * scale))
+        new_h = max(1, int(h * scale))
 
     if (new_w, new_h) == (w, h):
-        return im
+        return None
+
+    return new_w, new_h
+
+
+def _draft_for_resize(im: Image.Image, s: OptimizeSettings) -> tuple[int, int] | None:
+    """
+    For JPEGs that are going to be shrunk anyway, ask libjpeg to decode at
+    1/2, 1/4 or 1/8 scale (DCT-domain downscale, far fewer pixels decoded).
+
+    Must be called before im.load(). We ask for at least 2x the final size
+    so LANCZOS still has real detail to work with. Returns the final
+    (width, height) worked out from the full-size header, or None if the
+    decoder was left at full resolution.
+
+    Center crops are accounted for: the crop is worked out on the full-size
+    frame first, since it decides how far the kept region gets shrunk.
+    (libjpeg can't skip the cropped-away blocks, but at a reduced scale
+    they cost a fraction of a full decode.)
+    """
+    if im.format != "JPEG":
+        return None
+
+    w, h = im.size
+
+    # Orientations 5-8 swap width/height once exif_transpose runs
+    rotated = s.auto_orient and im.getexif().get(ExifTags.Base.Orientation, 1) in (5, 6, 7, 8)
+    size = (h, w) if rotated else (w, h)
 
-    return im.resize((new_w, new_h), Image.Resampling.LANCZOS)
+    if s.crop_ratio is not None:
+        box = _center_crop_box(size, float(s.crop_ratio))
+        if box is not None:
+            size = (box[2] - box[0], box[3] - box[1])
+
+    target = _resize_target(size, s)
+    if target is None:
+        return None
+
+    # Same shrink factor for the whole frame (orientation doesn't matter)
+    factor = 2 * max(target[0] / size[0], target[1] / size[1])
+    im.draft(None, (math.ceil(w * factor), math.ceil(h * factor)))
+
+    if im.size == (w, h):
+        return None
+    return target
 
 
 def _apply_center_crop(im: Image.Image, s: OptimizeSettings) -> Image.Image:
@@ -305,29 +767,35 @@ def _apply_center_crop(im: Image.Image, s: OptimizeSettings) -> Image.Image:
     if s.crop_ratio is None:
         return im
 
-    ratio = float(s.crop_ratio)
+    box = _center_crop_box(im.size, float(s.crop_ratio))
+    if box is None:
+        return im
+
+    return im.crop(box)
+
+
+def _center_crop_box(size: tuple[int, int], ratio: float) -> tuple[int, int, int, int] | None:
+    """Crop box for _apply_center_crop, or None if nothing needs cropping."""
     if ratio <= 0:
-        return im  # ignore invalid values safely
+        return None  # ignore invalid values safely
 
-    w, h = im.size
+    w, h = size
     if w <= 0 or h <= 0:
-        return im
+        return None
 
     current = w / h
 
     # Already basically at ratio (avoid tiny rounding crops)
     if abs(current - ratio) < 1e-6:
-        return im
+        return None
 
     if current > ratio:
         # Image is too wide -> crop width
         new_w = int(h * ratio)
         left = (w - new_w) // 2
-        box = (left, 0, left + new_w, h)
-    else:
-        # Image is too tall -> crop height
-        new_h = int(w / ratio)
-        top = (h - new_h) // 2
-        box = (0, top, w, top + new_h)
+        return (left, 0, left + new_w, h)
 
-    return im.crop(box)
+    # Image is too tall -> crop height
+    new_h = int(w / ratio)
+    top = (h - new_h) // 2
+    return (0, top, w, top + new_h)
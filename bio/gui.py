@@ -1,17 +1,32 @@
+import os
+import re
 import threading
-import queue
-from typing import Any
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
 
 from .batch import process_batch
-from .report import build_report, save_report_csv, save_report_json
+from .report import CsvReportWriter, FileReport, build_file_report, build_report, save_report_json
+from .results import ProcessResult
 from .settings import OptimizeSettings
 
 
 APP_VERSION = "1.0.0"
 
+# The status box keeps only this many lines; older ones are dropped.
+LOG_MAX_LINES = 500
+
+# Crop ratio: "16:9", "1:1", "4.5:3" or a plain number like "1.777"
+_RATIO_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(?::\s*(\d+(?:\.\d+)?)\s*)?$")
+
+
+def _same_dir(a: Path, b: Path) -> bool:
+    # Cheap string comparison first; resolve() (which stats every path
+    # component) only when that says they differ, to catch symlinks.
+    if os.path.normcase(os.path.abspath(a)) == os.path.normcase(os.path.abspath(b)):
+        return True
+    return a.resolve() == b.resolve()
+
 
 def run_app() -> None:
     app = BioGui()
@@ -47,11 +62,17 @@ class BioGui(tk.Tk):
         self.webp_quality = tk.StringVar(value="80")
         self.webp_lossless = tk.BooleanVar(value=False)
 
+        self.workers = tk.StringVar(value="")  # empty = one per CPU
+
         self._worker: threading.Thread | None = None
         self._cancel_event = threading.Event()
 
-        self._q: queue.Queue[tuple[Any, ...]] = queue.Queue()
-        self._polling = False
+        # Newest progress/file update posted by the worker; _apply_updates
+        # shows it on the Tk thread. Only the latest value matters, so a
+        # burst of updates costs one widget update.
+        self._pending_progress: tuple[int, int] | None = None
+        self._pending_file: str | None = None
+        self._update_scheduled = False
 
         self._option_widgets: list[tk.Widget] = []
 
@@ -108,6 +129,7 @@ class BioGui(tk.Tk):
         self.progress.pack(side="right", fill="x", expand=True, padx=(12, 0))
 
         self.status = tk.Text(root, height=7, wrap="word")
+        self._log_lines = 0
         self.status.pack(fill="both", expand=False, pady=(12, 0))
         self._log("Ready.")
 
@@ -240,6 +262,16 @@ class BioGui(tk.Tk):
         cb.pack(anchor="w", pady=(6, 0))
         self._option_widgets.append(cb)
 
+        row = ttk.Frame(parent)
+        row.pack(fill="x", pady=(10, 4))
+        ttk.Label(row, text="Workers:", width=12).pack(side="left")
+
+        workers_entry = ttk.Entry(row, textvariable=self.workers, width=8)
+        workers_entry.pack(side="left", padx=(6, 0))
+        self._option_widgets.append(workers_entry)
+
+        ttk.Label(row, text="(blank = all CPUs)", foreground="gray").pack(side="left", padx=(6, 0))
+
         ttk.Separator(parent).pack(fill="x", pady=10)
 
         ttk.Label(
@@ -290,30 +322,49 @@ class BioGui(tk.Tk):
         self._log("Running...")
         self._set_options_enabled(False)
 
+        self._pending_progress = None
+        self._pending_file = None
 
-        self._polling = True
-        self.after(50, self._poll_queue)
+        def schedule_update() -> None:
+            # after() may be called from the worker thread (Tcl is threaded and
+            # tkinter hands the call to the Tk thread). One scheduled call
+            # covers a whole burst of updates.
+            if not self._update_scheduled:
+                self._update_scheduled = True
+                self.after(0, self._apply_updates)
 
         def work():
             try:
                 def on_progress(current: int, total: int) -> None:
-                    self._q.put(("progress", current, total))
+                    self._pending_progress = (current, total)
+                    schedule_update()
 
                 def on_file(path: Path, current: int, total: int) -> None:
-                    self._q.put(("file", path.name, current, total))
-
-                results, summary = process_batch(
-                    inputs,
-                    settings,
-                    recursive=True,
-                    progress_callback=on_progress,
-                    cancel_event=self._cancel_event,
-                    file_callback=on_file,
-                )
-
-                report = build_report(results, summary)
+                    self._pending_file = path.name
+                    schedule_update()
+
+                # Report rows are built (and CSV rows written) as each result
+                # comes in, so nothing is left to loop over at the end.
+                file_reports: list[FileReport] = []
+
+                with CsvReportWriter(settings.output_dir / "report.csv") as csv_report:
+                    def on_result(r: ProcessResult, current: int, total: int) -> None:
+                        fr = build_file_report(r)
+                        file_reports.append(fr)
+                        csv_report.write(fr)
+
+                    results, summary = process_batch(
+                        inputs,
+                        settings,
+                        recursive=True,
+                        progress_callback=on_progress,
+                        cancel_event=self._cancel_event,
+                        file_callback=on_file,
+                        result_callback=on_result,
+                    )
+
+                report = build_report(results, summary, files=file_reports)
                 save_report_json(report, settings.output_dir / "report.json")
-                save_report_csv(report, settings.output_dir / "report.csv")
 
                 was_cancelled = self._cancel_event.is_set()
 
@@ -327,9 +378,10 @@ class BioGui(tk.Tk):
                     f"Report: {settings.output_dir / 'report.json'}\n"
                     f"CSV   : {settings.output_dir / 'report.csv'}\n"
                 )
-                self._q.put(("done", msg))
+                # Runs after any update scheduled above (after(0) calls fire in order)
+                self.after(0, self._finish_ok, msg)
             except Exception as ex:
-                self._q.put(("error", ex))
+                self.after(0, self._finish_err, ex)
 
         self._worker = threading.Thread(target=work, daemon=True)
         self._worker.start()
@@ -337,45 +389,19 @@ class BioGui(tk.Tk):
     def _on_cancel(self) -> None:
         if self._worker and self._worker.is_alive():
             self._cancel_event.set()
-            self._log("Cancel requested... finishing current file.")
+            self._log("Cancel requested... finishing files already in progress.")
             self.cancel_btn.config(state="disabled")
 
-    def _poll_queue(self) -> None:
-        try:
-            while True:
-                item = self._q.get_nowait()
-                kind = item[0]
-
-                if kind == "progress":
-                    _, current, total = item
-                    self._set_progress(int(current), int(total))
-
-                elif kind == "file":
-                    _, filename, current, total = item
-                    self.file_label.config(text=f"Processing: {filename}")
-
-                elif kind == "done":
-                    _, msg = item
-                    self._polling = False
-                    self._finish_ok(str(msg))
-                    return
-
-                elif kind == "error":
-                    _, ex = item
-                    self._polling = False
-                    self._finish_err(ex)
-                    return
-
-        except queue.Empty:
-            pass
-        except Exception as ex:
-            # If polling crashes, recover UI instead of freezing
-            self._polling = False
-            self._finish_err(ex)
-            return
+    def _apply_updates(self) -> None:
+        self._update_scheduled = False
 
-        if self._polling:
-            self.after(50, self._poll_queue)
+        progress = self._pending_progress
+        if progress is not None:
+            self._set_progress(*progress)
+
+        filename = self._pending_file
+        if filename is not None:
+            self.file_label.config(text=f"Processing: {filename}")
 
     def _finish_ok(self, msg: str) -> None:
         self.run_btn.config(state="normal")
@@ -402,7 +428,7 @@ class BioGui(tk.Tk):
 
         if not inp.exists() or not inp.is_dir():
             raise ValueError("Input folder does not exist.")
-        if inp.resolve() == out.resolve():
+        if _same_dir(inp, out):
             raise ValueError("Output folder cannot be the same as input folder.")
 
         # Parse ints safely
@@ -414,6 +440,9 @@ class BioGui(tk.Tk):
 
         crop = self._parse_ratio_or_none(self.crop_ratio.get())
 
+        workers_text = self.workers.get().strip()
+        workers = self._parse_int_range(workers_text, 1, 256, "Workers") if workers_text else None
+
         fmt = self.output_format.get().strip().lower()
         if fmt not in {"keep", "jpeg", "png", "webp"}:
             raise ValueError("Invalid output format.")
@@ -435,6 +464,7 @@ class BioGui(tk.Tk):
             webp_quality=webp_q,
             webp_lossless=bool(self.webp_lossless.get()),
             dry_run=bool(self.dry_run.get()),
+            workers=workers,
         )
 
         # Apply preset (optional)
@@ -452,20 +482,12 @@ class BioGui(tk.Tk):
         self.progress_label.config(text=f"{current} / {total}")
 
     def _set_options_enabled(self, enabled: bool) -> None:
-        for w in self._option_widgets:
-            try:
-                if not enabled:
-                    # Disable everything uniformly
-                    w.configure(state="disabled")
-                else:
-                    # Restore correct enabled state
-                    if isinstance(w, ttk.Combobox):
-                        w.configure(state="readonly")
-                    else:
-                        w.configure(state="normal")
-            except Exception:
-                # Ignore non-standard widgets safely
-                pass
+        # ttk state doesn't cascade from a parent frame, so each widget still
+        # needs its own "state" command, but they all go to Tcl as one script
+        # (one round trip instead of one per widget). Only the "disabled"
+        # flag is toggled, so Combobox keeps its "readonly" flag as is.
+        flag = "!disabled" if enabled else "disabled"
+        self.tk.eval("\n".join(f"{w} state {flag}" for w in self._option_widgets))
 
     def _parse_optional_int(self, text: str):
         t = text.strip()
@@ -484,18 +506,26 @@ class BioGui(tk.Tk):
         return v
 
     def _parse_ratio_or_none(self, text: str):
-        t = text.strip()
-        if not t:
+        if not text.strip():
             return None
-        if ":" in t:
-            a, b = t.split(":", 1)
-            num = float(a)
-            den = float(b)
-            if den == 0:
-                raise ValueError("Crop ratio denominator cannot be 0.")
-            return num / den
-        return float(t)
+        m = _RATIO_RE.match(text)
+        if m is None:
+            raise ValueError("Crop ratio must look like 16:9 or 1.777.")
+        num = float(m[1])
+        den = float(m[2]) if m[2] else 1.0
+        if den == 0:
+            raise ValueError("Crop ratio denominator cannot be 0.")
+        return num / den
 
     def _log(self, msg: str) -> None:
         self.status.insert("end", msg + "\n")
+        self._log_lines += msg.count("\n") + 1
+
+        # Cap the history: a Text widget that keeps growing gets slower
+        # with every insert on long batches.
+        excess = self._log_lines - LOG_MAX_LINES
+        if excess > 0:
+            self.status.delete("1.0", f"{excess + 1}.0")
+            self._log_lines = LOG_MAX_LINES
+
         self.status.see("end")
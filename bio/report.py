@@ -2,17 +2,21 @@ from __future__ import annotations
 
 import json
 import csv
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 
 from .batch import BatchSummary
 from .results import ProcessResult
 
 
-@dataclass(frozen=True)
-class FileReport:
+class FileReport(NamedTuple):
+    """
+    One row of the report. A NamedTuple: there is one per file and it is
+    just a record, so plain tuple construction and layout are all we need.
+    saved_percent is kept exact; writers round it when they emit it.
+    """
     src_path: str
     out_path: Optional[str]
     src_bytes: int
@@ -30,23 +34,32 @@ class BatchReport:
     files: List[FileReport]
 
 
-def build_report(results: List[ProcessResult], summary: BatchSummary) -> BatchReport:
+def build_file_report(r: ProcessResult) -> FileReport:
+    return FileReport(
+        str(r.src_path),
+        str(r.out_path) if r.out_path else None,
+        r.src_bytes,
+        r.out_bytes,
+        r.saved_bytes,
+        r.saved_percent,
+        r.changed,
+        r.skipped_reason,
+    )
+
+
+def build_report(
+    results: List[ProcessResult],
+    summary: BatchSummary,
+    files: Optional[List[FileReport]] = None,
+) -> BatchReport:
+    """
+    files: FileReports already built per result while the batch ran (e.g.
+    from process_batch's result_callback); built from results if omitted.
+    """
     created_utc = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
-    files: List[FileReport] = []
-    for r in results:
-        files.append(
-            FileReport(
-                src_path=str(r.src_path),
-                out_path=str(r.out_path) if r.out_path else None,
-                src_bytes=r.src_bytes,
-                out_bytes=r.out_bytes,
-                saved_bytes=r.saved_bytes,
-                saved_percent=round(r.saved_percent, 2),
-                changed=r.changed,
-                skipped_reason=r.skipped_reason,
-            )
-        )
+    if files is None:
+        files = [build_file_report(r) for r in results]
 
     summary_dict = {
         "total_files": summary.total_files,
@@ -61,46 +74,125 @@ def build_report(results: List[ProcessResult], summary: BatchSummary) -> BatchRe
     return BatchReport(created_utc=created_utc, summary=summary_dict, files=files)
 
 
+# Same text json.dump(..., indent=2, ensure_ascii=False) produces for one
+# FileReport inside the "files" list. Each value is encoded on its own with
+# the C encoder (indent=2 forces json's pure-Python encoder for the whole tree).
+_FILE_RECORD_JSON = (
+    "    {\n"
+    '      "src_path": %s,\n'
+    '      "out_path": %s,\n'
+    '      "src_bytes": %s,\n'
+    '      "out_bytes": %s,\n'
+    '      "saved_bytes": %s,\n'
+    '      "saved_percent": %s,\n'
+    '      "changed": %s,\n'
+    '      "skipped_reason": %s\n'
+    "    }"
+)
+_json_value = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _file_record(fr: FileReport) -> dict:
+    # orjson hook: it doesn't serialize NamedTuples itself
+    if not isinstance(fr, FileReport):
+        raise TypeError(f"Type is not JSON serializable: {type(fr).__name__}")
+    return {**fr._asdict(), "saved_percent": round(fr.saved_percent, 2)}
+
+
 def save_report_json(report: BatchReport, path: Path) -> None:
+    """
+    Write the report as indented JSON, one file record at a time, so no
+    dict copy of the whole report (asdict) is built first.
+
+    If orjson is installed it serializes the report directly instead
+    (same output, several times faster).
+    """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(report, default=_file_record, option=orjson.OPT_INDENT_2))
+        return
+
+    summary = json.dumps(report.summary, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+
     with path.open("w", encoding="utf-8") as f:
-        json.dump(asdict(report), f, indent=2, ensure_ascii=False)
+        f.write("{\n")
+        f.write(f'  "created_utc": {_json_value(report.created_utc)},\n')
+        f.write(f'  "summary": {summary},\n')
 
+        if not report.files:
+            f.write('  "files": []\n}')
+            return
 
-def save_report_csv(report: BatchReport, path: Path) -> None:
+        f.write('  "files": [\n')
+        sep = ""
+        for fr in report.files:
+            f.write(sep)
+            f.write(
+                _FILE_RECORD_JSON % (
+                    _json_value(fr.src_path),
+                    _json_value(fr.out_path),
+                    _json_value(fr.src_bytes),
+                    _json_value(fr.out_bytes),
+                    _json_value(fr.saved_bytes),
+                    _json_value(round(fr.saved_percent, 2)),
+                    _json_value(fr.changed),
+                    _json_value(fr.skipped_reason),
+                )
+            )
+            sep = ",\n"
+        f.write("\n  ]\n}")
+
+
+class CsvReportWriter:
     """
-    Save a flat, spreadsheet-friendly CSV report (one row per file).
+    report.csv written one row at a time, so rows can go out while the batch
+    is still running instead of all at the end. Use as a context manager.
     """
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
 
-    fieldnames = [
-        "src_path",
-        "out_path",
-        "src_bytes",
-        "out_bytes",
-        "saved_bytes",
-        "saved_percent",
-        "changed",
-        "skipped_reason",
-    ]
-
-    with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    def __init__(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._f = path.open("w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._f)
+        self._writer.writerow(FileReport._fields)
+
+    def write(self, fr: FileReport) -> None:
+        # csv.writer already writes None as an empty cell
+        self._writer.writerow(
+            (
+                fr.src_path,
+                fr.out_path,
+                fr.src_bytes,
+                fr.out_bytes,
+                fr.saved_bytes,
+                f"{fr.saved_percent:.2f}",
+                fr.changed,
+                fr.skipped_reason,
+            )
+        )
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> CsvReportWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
+
+def save_report_csv(report: BatchReport, path: Path) -> None:
+    """
+    Save a flat, spreadsheet-friendly CSV report (one row per file).
+    """
+    with CsvReportWriter(path) as writer:
         for fr in report.files:
-            writer.writerow(
-                {
-                    "src_path": fr.src_path,
-                    "out_path": fr.out_path or "",
-                    "src_bytes": fr.src_bytes,
-                    "out_bytes": fr.out_bytes,
-                    "saved_bytes": fr.saved_bytes,
-                    "saved_percent": fr.saved_percent,
-                    "changed": fr.changed,
-                    "skipped_reason": fr.skipped_reason or "",
-                }
-            )
+            writer.write(fr)
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessResult:
     """
     Output of processing a single image.
 
     Keeping it immutable (frozen=True) makes it easier to reason about.
+    slots=True: no per-instance __dict__, which adds up on 100k-file batches.
     """
     src_path: Path
     out_path: Optional[Path]  # None if we skipped writing
@@ -19,12 +20,14 @@ class ProcessResult:
     changed: bool
     skipped_reason: Optional[str] = None
 
-    @property
-    def saved_bytes(self) -> int:
-        return max(0, self.src_bytes - self.out_bytes)
+    # Derived from the sizes once, at construction (in the worker), so
+    # reports and totals just read them.
+    saved_bytes: int = field(init=False)
+    saved_percent: float = field(init=False)
 
-    @property
-    def saved_percent(self) -> float:
-        if self.src_bytes <= 0:
-            return 0.0
-        return (self.saved_bytes / self.src_bytes) * 100.0
+    def __post_init__(self) -> None:
+        saved = max(0, self.src_bytes - self.out_bytes)
+        percent = (saved / self.src_bytes) * 100.0 if self.src_bytes > 0 else 0.0
+        # frozen=True: fields can only be set through object.__setattr__
+        object.__setattr__(self, "saved_bytes", saved)
+        object.__setattr__(self, "saved_percent", percent)
@@ -1,4 +1,7 @@
+import multiprocessing
+
 from bio.gui import run_app
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # process pool workers in frozen builds
     run_app()